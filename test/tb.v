@@ -1,14 +1,17 @@
 `default_nettype none
-`timescale 1ns / 1ps
+`timescale 1ns / 1ns
 
 module tb ();
 
-  // Dump the signals to a VCD file
+  // Dump the signals to a VCD file (opt-in: build with WAVES=1, dumping
+  // a 420000-cycle frame otherwise dominates wall time)
+`ifdef WAVES
   initial begin
     $dumpfile("tb.vcd");
     $dumpvars(0, tb);
     #1;
   end
+`endif
 
   // Wire up the inputs and outputs
   reg clk;
@@ -20,6 +23,17 @@ module tb ();
   wire [7:0] uio_out;
   wire [7:0] uio_oe;
 
+  // Per-bit views of uo_out for cocotb: bits of a packed vector cannot
+  // be indexed or edge-triggered from Python, so expose them as nets
+  wire hsync_w = uo_out[7];
+  wire vsync_w = uo_out[3];
+  wire r0_w = uo_out[4];
+  wire r1_w = uo_out[0];
+  wire g0_w = uo_out[5];
+  wire g1_w = uo_out[1];
+  wire b0_w = uo_out[6];
+  wire b1_w = uo_out[2];
+
   `ifdef GL_TEST
     wire VPWR = 1'b1;
     wire VGND = 1'b0;